@@ -31,7 +31,7 @@ class Application:
         self.vs = cv2.VideoCapture(0)
         self.current_image = None
         self.model = load_model('cnn8grps_rad1_model.h5')
-        self.speak_engine = TextToSpeech(rate=100, voice_index=0)
+        self.speak_engine = TextToSpeech.get(rate=100, voice_index=0)
 
         self.ct = {}
         self.ct['blank'] = 0
@@ -61,13 +61,15 @@ sentences = [
     "The third sentence."
 ]
 
-for i, text in enumerate(sentences, 1):
-    try:
+# Queue all sentences, then run the event loop once so they play back-to-back
+try:
+    for i, text in enumerate(sentences, 1):
         print(f"   [{i}] {text}")
         engine.say(text)
-        engine.runAndWait()
-    except Exception as e:
-        print(f"   ✗ Failed: {e}")
+    engine.runAndWait()
+    print("✓ Multiple sentences completed")
+except Exception as e:
+    print(f"   ✗ Failed: {e}")
 
 print("\n[Test 6] Change rate and speak...")
 try:
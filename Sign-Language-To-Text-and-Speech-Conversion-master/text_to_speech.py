@@ -4,22 +4,195 @@ Text-to-Speech Module for Sign Language to Text and Speech Conversion
 This module provides a simple wrapper around pyttsx3 for converting
 predicted sign language text into speech output in real-time.
 
+Creating an instance starts a pyttsx3 engine and a worker thread, so
+callers should share one process-wide instance via TextToSpeech.get().
+
 Usage:
-    tts = TextToSpeech(rate=100, voice_index=0)
+    tts = TextToSpeech.get(rate=100, voice_index=0)
     tts.speak("Hello, this is a test")
     tts.set_property("rate", 150)  # change speed
+
+    # Pre-render a fixed vocabulary once; matching text is then played from WAV
+    tts.prerender(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), "tts_cache")
+
+    # From asyncio code, wait until the text has actually been spoken
+    await tts.speak_async("Hello again")
 """
 
 import pyttsx3
+import asyncio
+import concurrent.futures
+import ctypes
+import glob
+import itertools
+import sys
 import threading
 import queue
 import logging
-import time
+import os
+import re
+import tempfile
+import weakref
+
+try:
+    import winsound
+except ImportError:  # Not on Windows
+    winsound = None
+
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s:%(name)s:%(levelname)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+# Whitespace following terminal punctuation marks a sentence boundary
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text, max_parts):
+    """
+    Split text into sentences so playback can start after the first one.
+    
+    At most max_parts fragments are returned; any remainder is kept joined
+    in the last fragment so a long paragraph cannot overflow the queue.
+    """
+    parts = [p for p in _SENTENCE_BOUNDARY.split(text.strip()) if p]
+    if len(parts) > max_parts:
+        parts[max_parts - 1:] = [" ".join(parts[max_parts - 1:])]
+    return parts
+
+
+def _can_play_wav():
+    """Return True if a WAV playback backend (winsound or simpleaudio) is available."""
+    return winsound is not None or simpleaudio is not None
+
+
+def _play_wav(path):
+    """Play a WAV file synchronously on the calling thread."""
+    if winsound is not None:
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+    else:
+        simpleaudio.WaveObject.from_wave_file(path).play().wait_done()
+
+
+def _parse_cpu_list(text):
+    """Parse a sysfs CPU list such as "0-7,16" into a set of CPU numbers."""
+    cpus = set()
+    for part in text.strip().split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.update(range(int(first), int(last) + 1))
+        elif part:
+            cpus.add(int(part))
+    return cpus
+
+
+def _performance_cpus():
+    """
+    Return the performance cores of a hybrid (P/E-core, big.LITTLE) Linux
+    system, or None if the CPU is not hybrid or it can't be told.
+    
+    Max frequencies are not used: homogeneous CPUs with favoured cores
+    (Turbo Boost Max 3.0, AMD preferred cores) also differ slightly there.
+    """
+    # Intel hybrid parts expose separate PMUs for P-cores and E-cores
+    if os.path.exists("/sys/devices/cpu_atom/cpus"):
+        with open("/sys/devices/cpu_core/cpus") as f:
+            return _parse_cpu_list(f.read()) or None
+    # ARM big.LITTLE / DynamIQ report per-core scheduler capacity (max 1024)
+    capacity = {}
+    for path in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpu_capacity"):
+        cpu = int(os.path.basename(os.path.dirname(path))[3:])
+        with open(path) as f:
+            capacity[cpu] = int(f.read())
+    if len(set(capacity.values())) < 2:
+        return None
+    # Keep every core in the upper half of the range (big and prime cores)
+    cutoff = (min(capacity.values()) + max(capacity.values())) / 2
+    return {cpu for cpu, cap in capacity.items() if cap > cutoff}
+
+
+def _prioritize_current_thread():
+    """
+    Best-effort hint that the calling thread runs CPU-bound synthesis.
+    
+    Speech synthesis is compute-bound, and on hybrid CPUs it is much slower
+    when scheduled on efficiency cores. On Windows the thread priority is
+    raised to ABOVE_NORMAL (the scheduler then favours performance cores);
+    on Linux the thread is pinned to the performance cores of a hybrid CPU.
+    Failures are ignored; this is only an optimization.
+    """
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 1)  # THREAD_PRIORITY_ABOVE_NORMAL
+        elif hasattr(os, "sched_setaffinity"):
+            cpus = _performance_cpus()
+            if cpus:
+                cpus &= os.sched_getaffinity(0)
+            if cpus:
+                os.sched_setaffinity(0, cpus)  # 0 = calling thread on Linux
+                logger.debug("Pinned TTS worker to CPUs %s", sorted(cpus))
+    except Exception as e:
+        logger.debug("Could not adjust TTS worker scheduling: %s", e)
+
+
+def _remove_slot_dir(slot_dir, slots):
+    """Delete the WAV slot files and their private temp directory, ignoring errors."""
+    for i in range(slots):
+        _remove_quietly(os.path.join(slot_dir, f"slot_{i}.wav"))
+    try:
+        os.rmdir(slot_dir)
+    except OSError:
+        pass
+
+
+def _settle_waiter(waiter, done):
+    """Copy a worker-side completion future onto an asyncio future (see speak_async())."""
+    if waiter.done():
+        return
+    if done.cancelled():
+        waiter.set_result(False)
+    elif done.exception() is not None:
+        waiter.set_exception(done.exception())
+    else:
+        waiter.set_result(True)
+
+
+def _release_engine(engine, tokens=()):
+    """
+    Let go of a pyttsx3 engine.
+    
+    Callbacks registered with connect() are disconnected first: pyttsx3.init()
+    hands back the cached engine while it is still referenced, so a reinit
+    would otherwise register them a second time.
+    
+    endLoop() is only valid while the engine's loop is running (after
+    runAndWait() returns it raises RuntimeError), so it is only called then;
+    otherwise dropping the reference lets GC release the driver's COM objects.
+    """
+    for token in tokens:
+        try:
+            engine.disconnect(token)
+        except Exception as e:
+            logger.debug("disconnect() failed while releasing engine: %s", e)
+    if getattr(engine, "_inLoop", False):
+        try:
+            engine.endLoop()
+        except Exception as e:
+            logger.debug("endLoop() failed while releasing engine: %s", e)
+
+
+def _remove_quietly(path):
+    """Delete a temporary file, ignoring errors (e.g. it is already gone)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 
 class TextToSpeech:
     """
@@ -27,8 +200,48 @@ class TextToSpeech:
     
     NOTE: On Windows, pyttsx3 (SAPI5) works best when initialized and used from the main thread.
     This implementation uses a background thread with proper error handling and initialization.
+    The worker thread owns the only engine instance. Property changes are recorded and
+    applied by the worker right before its next utterance; other engine calls are sent
+    to it through the speech queue so they run in order with queued speech.
+    When winsound (Windows) or simpleaudio is available, speech is rendered to WAV files
+    with save_to_file() and played by a separate playback thread.
     """
     
+    # Maximum queued utterances handed to the driver per runAndWait() call;
+    # kept small so stop() is not stuck behind a long backlog
+    MAX_BATCH = 8
+    
+    # Maximum pending utterances; once full the oldest is dropped so the spoken
+    # output never lags arbitrarily far behind the live predictions
+    MAX_QUEUED = 8
+    
+    # Number of reusable WAV files speech is rendered into before playback
+    WAV_SLOTS = 3
+    
+    # Shared instance handed out by get()
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, rate=100, voice_index=0):
+        """
+        Return the shared TextToSpeech instance, creating it on first use.
+        
+        The arguments only apply when the instance is created (or re-created
+        after stop()); use set_property() to change an existing one.
+        
+        Args:
+            rate (int): Speech rate in words per minute (default: 100)
+            voice_index (int): Voice index (0=male, 1=female, etc., depends on OS)
+        
+        Returns:
+            TextToSpeech: The shared instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.is_running:
+                cls._instance = cls(rate=rate, voice_index=voice_index)
+            return cls._instance
+    
     def __init__(self, rate=100, voice_index=0):
         """
         Initialize the Text-to-Speech engine.
@@ -36,45 +249,65 @@ class TextToSpeech:
         Args:
             rate (int): Speech rate in words per minute (default: 100)
             voice_index (int): Voice index (0=male, 1=female, etc., depends on OS)
+        
+        Raises:
+            RuntimeError: If the worker thread could not initialize its engine
         """
+        self._playback_queue = None
+        self.playback_thread = None
+        self._slot_dir = None
+        self._slot_cleanup = None
         try:
             logger.info("Initializing pyttsx3 engine...")
-            # Initialize engine (use 'sapi5' backend explicitly on Windows if needed)
-            self.engine = pyttsx3.init()
+            # Requested engine settings; the worker applies any that changed
+            # right before its next utterance (see _sync_properties())
+            self._properties = {"rate": rate, "volume": 1.0}
+            self._applied = {}  # What the worker's engine currently has; worker-only
+            self._voice_index = voice_index
+            self._voice_ids = None  # Enumerated once by the worker on first init
             
-            # Verify engine is valid
-            if self.engine is None:
-                raise RuntimeError("pyttsx3.init() returned None")
-            
-            # Set voice rate
-            self.engine.setProperty("rate", rate)
-            logger.info(f"Set speech rate to {rate}")
-            
-            # Set volume (0.0 to 1.0)
-            self.engine.setProperty("volume", 1.0)
-            
-            # Set voice (0 = first voice, 1 = second, etc.)
-            voices = self.engine.getProperty("voices")
-            logger.info(f"Available voices: {len(voices)}")
-            for i, voice in enumerate(voices):
-                logger.info(f"  Voice {i}: {voice.name}")
-            
-            if voice_index < len(voices):
-                self.engine.setProperty("voice", voices[voice_index].id)
-                logger.info(f"Using voice: {voices[voice_index].name}")
-            else:
-                logger.warning(f"Voice index {voice_index} not available; using default")
-            
-            # Queue for thread-safe speech requests
-            self.speech_queue = queue.Queue()
+            # Queue for thread-safe requests: (text_or_command, done_future_or_None)
+            self.speech_queue = queue.Queue(maxsize=self.MAX_QUEUED)
+            self._enqueue_lock = threading.Lock()
+            self._speaking = ()  # Texts of the batch the worker is currently speaking
+            self._cache = {}  # Lower-cased text -> pre-rendered WAV path (see prerender())
             self.is_running = True
             
+            # With a WAV playback backend, the worker renders speech to files and
+            # this thread plays them, so playback overlaps the next synthesis.
+            # Items are (wav_path_or_None, done_future_or_None, is_slot).
+            # Rendering reuses a fixed set of slot files instead of creating one
+            # per utterance; the playback thread hands a slot back once played.
+            self._free_slots = queue.Queue()
+            if _can_play_wav():
+                self._slot_dir = tempfile.mkdtemp(prefix="tts_")
+                # Removed by stop(), or at interpreter exit if stop() is never called
+                self._slot_cleanup = weakref.finalize(self, _remove_slot_dir, self._slot_dir, self.WAV_SLOTS)
+                for i in range(self.WAV_SLOTS):
+                    self._free_slots.put(os.path.join(self._slot_dir, f"slot_{i}.wav"))
+                self._playback_queue = queue.Queue()
+                self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True, name="TTS-Playback")
+                self.playback_thread.start()
+            
             # Start background speech thread (daemon, will not block shutdown)
+            # and wait for it to report whether its engine came up
+            self._ready = threading.Event()
+            self._init_error = None
             self.speech_thread = threading.Thread(target=self._speech_worker, daemon=True, name="TTS-Worker")
             self.speech_thread.start()
+            if not self._ready.wait(timeout=10):
+                raise RuntimeError("Timed out waiting for TTS worker to initialize")
+            if self._init_error is not None:
+                raise RuntimeError(f"TTS worker failed to initialize: {self._init_error}") from self._init_error
             logger.info("Text-to-Speech engine initialized successfully; background thread started")
-            
+        
         except Exception as e:
+            self.is_running = False
+            # Don't leave the playback thread blocked or the slot dir behind
+            if self._playback_queue is not None:
+                self._playback_queue.put(None)
+            if self._slot_cleanup is not None:
+                self._slot_cleanup()
             logger.error(f"Failed to initialize TTS engine: {e}", exc_info=True)
             raise
     
@@ -83,84 +316,358 @@ class TextToSpeech:
         Background worker thread that processes speech requests.
         Initializes its own pyttsx3 engine instance (required on Windows SAPI5).
         
-        IMPORTANT: On Windows, pyttsx3 engine state can get "stuck" after runAndWait().
-        Solution: Reinitialize engine after each speech to reset internal state.
+        The engine is created once and reused for every utterance. It is only
+        reinitialized when synthesis raises, or when the driver still reports
+        itself busy after runAndWait() (the "stuck event loop" symptom on SAPI5).
+        
+        When the driver plays speech live, each utterance is said under a unique
+        name and its done future is resolved from the driver's finished-utterance
+        event, so a waiter on the first text of a batch does not wait for the
+        whole batch's runAndWait().
         """
         logger.info("TTS worker thread started")
+        _prioritize_current_thread()
         worker_engine = None
+        finished_token = None
+        live_done = {}  # Utterance name -> done future, for live say() only
+        utterance_ids = itertools.count()
+        
+        def on_finished(name, completed):
+            """finished-utterance callback: resolve that utterance's waiter."""
+            done = live_done.pop(name, None)
+            if done is not None and not done.done():
+                done.set_result(None)
         
         def init_engine():
             """Helper to initialize or reinitialize the engine."""
-            nonlocal worker_engine
+            nonlocal worker_engine, finished_token
             try:
-                # If engine exists, try to close it first
+                # If engine exists, release it first
                 if worker_engine is not None:
-                    try:
-                        worker_engine.endLoop()
-                    except:
-                        pass
+                    _release_engine(worker_engine, [finished_token] if finished_token else ())
                     worker_engine = None
+                    finished_token = None
                 
                 # Create fresh engine instance
                 worker_engine = pyttsx3.init()
-                worker_engine.setProperty("rate", 100)
-                worker_engine.setProperty("volume", 1.0)
-                voices = worker_engine.getProperty("voices")
-                if voices:
-                    worker_engine.setProperty("voice", voices[0].id)
+                if worker_engine is None:
+                    raise RuntimeError("pyttsx3.init() returned None")
+                
+                # Set voice (0 = first voice, 1 = second, etc.); voices are
+                # enumerated only once, reinits reuse the cached ids
+                if self._voice_ids is None:
+                    voices = worker_engine.getProperty("voices")
+                    logger.info(f"Available voices: {len(voices)}")
+                    for i, voice in enumerate(voices):
+                        logger.info(f"  Voice {i}: {voice.name}")
+                    self._voice_ids = [voice.id for voice in voices]
+                    if self._voice_index < len(voices):
+                        self._properties.setdefault("voice", self._voice_ids[self._voice_index])
+                        logger.info(f"Using voice: {voices[self._voice_index].name}")
+                    else:
+                        logger.warning(f"Voice index {self._voice_index} not available; using default")
+                
+                self._applied = {}
+                self._sync_properties(worker_engine)
+                if self._playback_queue is None:
+                    finished_token = worker_engine.connect("finished-utterance", on_finished)
                 logger.debug("Engine (re)initialized")
                 return True
             except Exception as e:
                 logger.error(f"Failed to initialize engine in worker thread: {e}", exc_info=True)
+                if not self._ready.is_set():
+                    self._init_error = e
                 return False
         
         # Initialize engine on startup
-        if not init_engine():
+        ok = init_engine()
+        self._ready.set()
+        if not ok:
             return
         
         while self.is_running:
             try:
-                # Wait for text to speak (timeout prevents blocking on exit)
-                text = self.speech_queue.get(timeout=1.0)
-                if text is None:  # Shutdown signal
+                # Block until there is work; stop() wakes us with a None sentinel
+                item = self.speech_queue.get()
+                if item is None:  # Shutdown signal
                     logger.info("TTS worker received shutdown signal")
                     break
                 
-                if text and text.strip():  # Only speak non-empty text
-                    logger.info(f"Speaking: {text}")
+                # Drain whatever else is already waiting so the driver can play
+                # the utterances back-to-back within a single runAndWait()
+                batch = [item]
+                shutdown = False
+                while len(batch) < self.MAX_BATCH:
                     try:
-                        worker_engine.say(text)
-                        worker_engine.runAndWait()
-                        logger.info(f"Finished speaking: {text}")
-                        
-                        # CRITICAL FIX: Reinitialize engine after each speech on Windows
-                        # This prevents the event loop from getting stuck
-                        logger.debug("Reinitializing engine for next speech...")
+                        item = self.speech_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        shutdown = True
+                        break
+                    batch.append(item)
+                
+                # Only speak non-empty text
+                texts = [text for text, _ in batch if isinstance(text, str) and text.strip()]
+                if texts:
+                    logger.debug("Speaking: %s", texts)
+                self._speaking = tuple(texts)
+                # Utterances submitted to the driver but not yet through runAndWait():
+                # (wav_path_or_None, done, is_slot) in queue order
+                rendered = []
+                needs_run = False
+                try:
+                    def flush():
+                        """Run the driver over pending utterances and pass them on in order."""
+                        nonlocal needs_run
+                        if needs_run:
+                            worker_engine.runAndWait()
+                            needs_run = False
+                        live_done.clear()
+                        for path, done, is_slot in rendered:
+                            if self._playback_queue is not None:
+                                self._playback_queue.put((path, done, is_slot))
+                            elif done is not None and not done.done():
+                                done.set_result(None)
+                        rendered.clear()
+                    
+                    # Live text is batched into one runAndWait(); rendered text
+                    # and engine commands flush pending items first to keep ordering
+                    for payload, done in batch:
+                        if not isinstance(payload, str):
+                            flush()
+                            self._run_command(payload, done, worker_engine)
+                        elif not payload.strip():
+                            rendered.append((None, done, False))
+                        elif (clip := self._cache.get(payload.lower())) is not None:
+                            rendered.append((clip, done, False))
+                        elif self._playback_queue is not None:
+                            # Render to a WAV and let the playback thread play it, so
+                            # the driver never has to drive the audio device itself.
+                            # Each clip is handed over as soon as it is rendered so
+                            # playback of the first sentence overlaps the rest; if
+                            # every slot is taken, wait for playback to free one.
+                            flush()
+                            path = self._free_slots.get()
+                            rendered.append((path, done, True))
+                            self._sync_properties(worker_engine)
+                            worker_engine.save_to_file(payload, path)
+                            needs_run = True
+                            flush()
+                        else:
+                            self._sync_properties(worker_engine)
+                            # Register before say(): drivers may finish synchronously
+                            name = f"utterance-{next(utterance_ids)}"
+                            if done is not None:
+                                live_done[name] = done
+                            rendered.append((None, done, False))
+                            worker_engine.say(payload, name)
+                            needs_run = True
+                    flush()
+                    if texts:
+                        logger.debug("Finished synthesizing: %s", texts)
+                    
+                    # Only reset the engine if its event loop did not settle
+                    if worker_engine.isBusy():
+                        logger.debug("Engine still busy after runAndWait(), reinitializing...")
                         if not init_engine():
                             logger.warning("Engine reinitialization failed, continuing anyway...")
-                            
-                    except Exception as e:
-                        logger.error(f"Error during speech synthesis: {e}", exc_info=True)
-                        # Try to reinit on error
-                        init_engine()
-                else:
-                    logger.debug("Received empty text, skipping")
-                    
-            except queue.Empty:
-                # Timeout is normal, just loop again
-                continue
+                
+                except Exception as e:
+                    logger.error(f"Error during speech synthesis: {e}", exc_info=True)
+                    self._resolve(batch, e)
+                    live_done.clear()
+                    for path, _, is_slot in rendered:
+                        if is_slot:
+                            self._free_slots.put(path)
+                    # Try to reinit on error
+                    init_engine()
+                finally:
+                    self._speaking = ()
+                
+                if shutdown:
+                    logger.info("TTS worker received shutdown signal")
+                    break
+            
             except Exception as e:
                 logger.error(f"Unexpected error in speech worker: {e}", exc_info=True)
         
-        # Cleanup on exit
-        try:
-            if worker_engine is not None:
-                worker_engine.endLoop()
-        except:
-            pass
+        # Cleanup on exit; nobody will speak what is left, so release its waiters
+        while True:
+            try:
+                item = self.speech_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1] is not None:
+                item[1].cancel()
+        if worker_engine is not None:
+            _release_engine(worker_engine, [finished_token] if finished_token else ())
+            worker_engine = None
+        
+        # Let the playback thread finish what was already rendered, then exit
+        if self._playback_queue is not None:
+            self._playback_queue.put(None)
         
         logger.info("TTS worker thread exiting")
     
+    def _playback_worker(self):
+        """
+        Background thread that plays rendered WAV files one after another.
+        
+        Playback is synchronous here so clips never cut each other off, while
+        the speech worker is already synthesizing the next batch.
+        """
+        while True:
+            item = self._playback_queue.get()
+            if item is None:  # Shutdown signal
+                break
+            path, done, is_slot = item
+            try:
+                if path is not None:
+                    _play_wav(path)
+                if done is not None and not done.done():
+                    done.set_result(None)
+            except Exception as e:
+                logger.error(f"Error during playback: {e}", exc_info=True)
+                if done is not None and not done.done():
+                    done.set_exception(e)
+            finally:
+                if is_slot:
+                    self._free_slots.put(path)
+        logger.info("TTS playback thread exiting")
+    
+    def _sync_properties(self, engine):
+        """Apply requested settings that differ from what the engine has (worker thread only)."""
+        for name, value in list(self._properties.items()):
+            if self._applied.get(name) != value:
+                engine.setProperty(name, value)
+                self._applied[name] = value
+    
+    @staticmethod
+    def _run_command(command, done, engine):
+        """Run a queued engine command on the worker thread and complete its future."""
+        try:
+            result = command(engine)
+        except Exception as e:
+            logger.error(f"Error running engine command: {e}", exc_info=True)
+            if done is not None:
+                done.set_exception(e)
+        else:
+            if done is not None:
+                done.set_result(result)
+    
+    @staticmethod
+    def _resolve(batch, error=None):
+        """Complete the done futures attached to a batch of queue items."""
+        for _, done in batch:
+            if done is None or done.done():
+                continue
+            if error is None:
+                done.set_result(None)
+            else:
+                done.set_exception(error)
+    
+    def _put(self, item, timeout=None):
+        """
+        Put an item on the bounded queue; caller must hold _enqueue_lock.
+        
+        When the queue is full and timeout is None the oldest pending text is
+        dropped to make room; otherwise put() blocks for up to timeout seconds
+        and raises queue.Full. Engine commands are never dropped.
+        """
+        if timeout is not None:
+            self.speech_queue.put(item, timeout=timeout)
+            return
+        while True:
+            try:
+                self.speech_queue.put_nowait(item)
+                return
+            except queue.Full:
+                if not self._drop_oldest():
+                    # Only commands are pending; wait for the worker to make room
+                    self.speech_queue.put(item)
+                    return
+    
+    def _enqueue(self, text, done=None, timeout=None, coalesce=True):
+        """
+        Put text on the speech queue, coalescing it with pending partial input.
+        
+        The sign-language pipeline tends to emit growing prefixes of the same
+        word ("HE", "HEL", "HELLO") from consecutive speak() calls. Pending
+        fire-and-forget items at the tail of the queue that are a prefix of the
+        new text are replaced by it, and an exact repeat of what is being spoken
+        right now is dropped. Items with a done future are never coalesced away
+        since a caller is waiting on them.
+        
+        With coalesce=False the text is queued as is; callers pass that for
+        every sentence of a call but the first, so repeated sentences inside
+        one speak() call ("Stop. Stop.") are kept.
+        
+        See _put() for what happens when the queue is full.
+        """
+        with self._enqueue_lock:
+            if not self.is_running:
+                logger.debug("TTS engine stopped; ignoring text: %s", text)
+                if done is not None:
+                    done.cancel()
+                return
+            if not coalesce:
+                self._put((text, done), timeout=timeout)
+                return
+            if done is None and text in self._speaking and self.speech_queue.empty():
+                logger.debug("Dropping duplicate of current utterance: %s", text)
+                return
+            with self.speech_queue.mutex:
+                pending = self.speech_queue.queue
+                while (pending and pending[-1] is not None and pending[-1][1] is None
+                       and isinstance(pending[-1][0], str) and text.startswith(pending[-1][0])):
+                    logger.debug("Coalescing pending text %r into %r", pending[-1][0], text)
+                    pending.pop()
+            self._put((text, done), timeout=timeout)
+    
+    def _submit(self, command):
+        """
+        Queue a callable to run against the worker's engine, in order with speech.
+        
+        Args:
+            command (callable): Called as command(engine) on the worker thread
+        
+        Returns:
+            concurrent.futures.Future: Resolved with the command's return value
+        """
+        done = concurrent.futures.Future()
+        with self._enqueue_lock:
+            if not self.is_running:
+                raise RuntimeError("TTS engine is stopped")
+            self._put((command, done))
+        return done
+    
+    def _drop_oldest(self):
+        """
+        Discard the oldest pending text, cancelling its done future.
+        
+        Returns:
+            bool: False if nothing could be dropped (only commands are pending)
+        """
+        with self.speech_queue.mutex:
+            pending = self.speech_queue.queue
+            for i, item in enumerate(pending):
+                if item is not None and isinstance(item[0], str):
+                    del pending[i]
+                    self.speech_queue.not_full.notify()
+                    break
+            else:
+                return False
+        text, done = item
+        logger.warning("Speech queue full; dropping oldest text: %s", text)
+        if done is not None:
+            done.cancel()
+        return True
+    
+    def qsize(self):
+        """Return the approximate number of utterances waiting to be spoken."""
+        return self.speech_queue.qsize()
+    
     def speak(self, text):
         """
         Queue text to be spoken (non-blocking - queues and returns immediately).
@@ -171,36 +678,140 @@ class TextToSpeech:
         if not text or not text.strip():
             logger.debug("speak() called with empty text")
             return
-        logger.debug(f"Queueing text for speech: {text}")
-        self.speech_queue.put(text)
+        logger.debug("Queueing text for speech: %s", text)
+        # Only the first sentence is coalesced with earlier input; the rest of
+        # the call is queued as is so repeated sentences are all spoken
+        for i, sentence in enumerate(_split_sentences(text, self.MAX_QUEUED)):
+            self._enqueue(sentence, coalesce=i == 0)
     
-    def speak_blocking(self, text):
+    async def speak_async(self, text):
         """
-        Speak text immediately using background thread and wait briefly.
-        This ensures speech happens but doesn't block the main loop for too long.
+        Queue text to be spoken and wait (asynchronously) until it has been spoken.
+        
+        Synthesis still runs on the TTS worker thread, which owns the engine
+        (SAPI5 requires single-threaded COM access); the coroutine only awaits
+        a completion future. It is resolved by the playback thread once the
+        rendered clip has played, or by the worker after runAndWait() when
+        speech is played live by the driver.
+        
+        Args:
+            text (str): Text to convert to speech
+        
+        Returns:
+            bool: True once spoken; False if the text was empty, dropped from a
+            full queue, or the engine was stopped before speaking it
+        """
+        if not text or not text.strip():
+            logger.debug("speak_async() called with empty text")
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        done = concurrent.futures.Future()
+        # Relay by hand rather than with asyncio.wrap_future(): a dropped text
+        # must not surface as a cancellation of the caller's task, and
+        # cancelling the caller must not reach into the worker's future
+        def relay(fut):
+            try:
+                loop.call_soon_threadsafe(_settle_waiter, waiter, fut)
+            except RuntimeError:
+                pass  # Event loop already closed; nobody is waiting any more
+        
+        done.add_done_callback(relay)
+        logger.debug("Queueing text for speech: %s", text)
+        sentences = _split_sentences(text, self.MAX_QUEUED)
+        for i, sentence in enumerate(sentences[:-1]):
+            self._enqueue(sentence, coalesce=i == 0)
+        # Sentences are spoken in order, so the last one completing means all have
+        self._enqueue(sentences[-1], done, coalesce=len(sentences) == 1)
+        return await waiter
+    
+    def speak_blocking(self, text, timeout=30):
+        """
+        Speak text using the background thread and wait until it has been spoken.
+        
+        Returns as soon as the worker signals completion, so short clips do not
+        cost a fixed delay and long ones are not cut short by one.
         
         Args:
             text (str): Text to convert to speech
+            timeout (float): Maximum seconds to wait for speech to finish (default: 30)
         """
         if text and text.strip():
-            logger.info(f"Queueing text for speech (will wait up to 5 sec): {text}")
-            self.speech_queue.put(text)
-            # Give TTS a chance to start speaking
-            time.sleep(0.5)
+            logger.debug("Queueing text for speech (will wait up to %s sec): %s", timeout, text)
+            done = concurrent.futures.Future()
+            sentences = _split_sentences(text, self.MAX_QUEUED)
+            try:
+                for i, sentence in enumerate(sentences[:-1]):
+                    self._enqueue(sentence, timeout=1.0, coalesce=i == 0)
+                self._enqueue(sentences[-1], done, timeout=1.0, coalesce=len(sentences) == 1)
+            except queue.Full:
+                logger.warning(f"Speech queue still full after 1 sec; dropping text: {text}")
+                return
+            try:
+                done.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                logger.warning(f"Speech did not finish within {timeout} sec: {text}")
+            except concurrent.futures.CancelledError:
+                logger.warning(f"Speech was dropped from the queue: {text}")
+            except Exception as e:
+                logger.error(f"Error during speech synthesis: {e}")
+    
+    def prerender(self, tokens, cache_dir):
+        """
+        Synthesize a fixed vocabulary to WAV files once and play them on later requests.
+        
+        Sign-language output is mostly a small set of letters and words, so
+        re-running synthesis for each of them is wasted work. After this call,
+        speaking a token (case-insensitive) plays its cached WAV instead.
+        The cache is cleared when rate, voice or volume change. Blocks until
+        the worker has rendered every token.
+        
+        Args:
+            tokens (list[str]): Texts to pre-render (e.g. letters A-Z)
+            cache_dir (str): Directory to write the WAV files to
+        """
+        if not _can_play_wav():
+            logger.warning("No WAV playback backend (winsound/simpleaudio); skipping prerender")
+            return
+        
+        def render(engine):
+            self._sync_properties(engine)
+            rendered = {}
+            for token in tokens:
+                if not token or not token.strip():
+                    continue
+                key = token.lower()
+                name = re.sub(r'[^a-z0-9]+', '_', key).strip('_') or "token"
+                path = os.path.abspath(os.path.join(cache_dir, f"{name}_{len(rendered)}.wav"))
+                engine.save_to_file(token, path)
+                rendered[key] = path
+            engine.runAndWait()
+            self._cache.update(rendered)
+            return len(rendered)
+        
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            count = self._submit(render).result()
+            logger.info(f"Pre-rendered {count} utterances to {cache_dir}")
+        except Exception as e:
+            logger.error(f"Error pre-rendering speech: {e}", exc_info=True)
     
     def set_property(self, property_name, value):
         """
         Set a property of the TTS engine (rate, volume, voice).
-        Note: Changes may not apply to already-queued speech.
+        
+        Only the requested value is recorded here; the worker applies it to its
+        engine right before the next utterance it synthesizes, so repeated
+        changes cost no engine calls and never race the worker thread.
         
         Args:
             property_name (str): Property name ('rate', 'volume', 'voice')
             value: Property value
         """
         try:
-            # Update both main and worker engine if possible
-            if hasattr(self, 'engine') and self.engine:
-                self.engine.setProperty(property_name, value)
+            self._properties[property_name] = value
+            if property_name in ("rate", "voice", "volume"):
+                self._cache.clear()  # Pre-rendered clips no longer match
             logger.info(f"Set {property_name} to {value}")
         except Exception as e:
             logger.error(f"Error setting property {property_name}: {e}", exc_info=True)
@@ -209,6 +820,9 @@ class TextToSpeech:
         """
         Get a property of the TTS engine.
         
+        Properties set through this class are answered from the cached settings;
+        anything else is read from the worker's engine (waits up to 5 sec).
+        
         Args:
             property_name (str): Property name ('rate', 'volume', etc.)
         
@@ -216,22 +830,29 @@ class TextToSpeech:
             Property value or None if error
         """
         try:
-            if hasattr(self, 'engine') and self.engine:
-                return self.engine.getProperty(property_name)
+            if property_name in self._properties:
+                return self._properties[property_name]
+            return self._submit(lambda engine: engine.getProperty(property_name)).result(timeout=5)
         except Exception as e:
             logger.error(f"Error getting property {property_name}: {e}", exc_info=True)
         return None
-
+    
     
     def stop(self):
         """Stop the TTS engine and clean up resources."""
         try:
             logger.info("Stopping TTS engine...")
-            self.is_running = False
-            self.speech_queue.put(None)  # Signal worker to exit
+            with self._enqueue_lock:
+                self.is_running = False
+                # Signal worker to exit, making room in the bounded queue if needed
+                self._put(None)
             # Wait for thread to finish (max 3 seconds)
-            if hasattr(self, 'speech_thread') and self.speech_thread.is_alive():
+            if self.speech_thread.is_alive():
                 self.speech_thread.join(timeout=3)
+            if self.playback_thread is not None and self.playback_thread.is_alive():
+                self.playback_thread.join(timeout=3)
+            if self._slot_cleanup is not None:
+                self._slot_cleanup()
             logger.info("Text-to-Speech engine stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping TTS engine: {e}", exc_info=True)
@@ -246,21 +867,18 @@ def test_tts():
         
         # Test basic speech
         print("\n[Test 1] Basic speech")
-        tts.speak("Hello, this is a test of the text to speech system.")
-        time.sleep(3)
+        tts.speak_blocking("Hello, this is a test of the text to speech system.")
         
         # Test multiple sentences
         print("\n[Test 2] Multiple sentences (non-blocking)")
         tts.speak("This is the first sentence.")
         tts.speak("This is the second sentence.")
-        tts.speak("This is the third sentence.")
-        time.sleep(6)
+        tts.speak_blocking("This is the third sentence.")  # Returns once all three are spoken
         
         # Test property change
         print("\n[Test 3] Change speech rate")
         tts.set_property("rate", 150)
-        tts.speak("This sentence should be faster.")
-        time.sleep(3)
+        tts.speak_blocking("This sentence should be faster.")
         
         tts.stop()
         print("\n✓ Test complete!")
@@ -272,5 +890,3 @@ def test_tts():
 
 if __name__ == "__main__":
     test_tts()
-if __name__ == "__main__":
-    test_tts()